@@ -0,0 +1,70 @@
+"""
+Fixtures shared by the tests of all the services.
+
+The startup benchmarks run each measurement in a fresh
+interpreter so the import cost is really paid, the same way
+it is when a container cold starts. They are marked as
+startup, so they can be run apart from the unit tests with
+-m startup (or skipped with -m "not startup").
+
+Each service sets budgets close to its own measured numbers.
+On slower machines they can all be scaled with the env var
+STARTUP_BUDGET_FACTOR.
+"""
+
+import json
+import subprocess  # noqa: S404
+import sys
+from os import environ, getenv
+from pathlib import Path
+from typing import Callable, Dict
+
+import pytest
+
+PROJECT_FOLDER = Path(__file__).parents[1]
+
+
+def pytest_configure(config):
+    """Register the marker of the startup benchmarks."""
+    config.addinivalue_line(
+        "markers", "startup: benchmark of the import and first request latency"
+    )
+
+
+@pytest.fixture
+def run_benchmark() -> Callable[[str], Dict[str, float]]:
+    """
+    Provide a runner for scripts in a fresh interpreter.
+
+    Returns:
+        Callable[[str], Dict[str, float]]: Function running the given
+            Python code and returning the measurements it printed
+            as JSON in its last line.
+    """
+
+    def run(script: str) -> Dict[str, float]:
+        env = dict(environ, PYTHONPATH=str(PROJECT_FOLDER))
+        output = subprocess.run(  # noqa: S603
+            [sys.executable, "-c", script],
+            cwd=PROJECT_FOLDER,
+            env=env,
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        return json.loads(output.splitlines()[-1])
+
+    return run
+
+
+@pytest.fixture
+def startup_budget() -> Callable[[float], float]:
+    """
+    Provide the scaling of the startup budgets.
+
+    Returns:
+        Callable[[float], float]: Function scaling a budget, in
+            seconds, by the env var STARTUP_BUDGET_FACTOR.
+    """
+    factor = float(getenv("STARTUP_BUDGET_FACTOR", "1.0"))
+    return lambda seconds: seconds * factor
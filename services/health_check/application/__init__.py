@@ -1 +0,0 @@
-from services.health_check.application.__main__ import *
@@ -1,15 +1,22 @@
 """Module to communicate with the Popular Repo App API."""
 
 import logging
+from typing import Optional
 
 import requests
 
 from services.health_check.application.config import Config
 
 
-def check_popular_repo_app_health():
-    """Check if Popular Repositories App is healthy."""
-    response = requests.get(Config.POPULAR_REPOS_API_URL)
+def check_popular_repo_app_health(url: Optional[str] = None):
+    """
+    Check if Popular Repositories App is healthy.
+
+    Args:
+        url (Optional[str]): Health endpoint of the app. Defaults
+            to the one in the configuration.
+    """
+    response = requests.get(url or Config.POPULAR_REPOS_API_URL)
     if response.status_code == 200:
         logging.info("Application healthy.")
     else:
@@ -0,0 +1,32 @@
+"""Module to build the health checker's job scheduler."""
+
+from datetime import datetime
+from typing import Type
+
+from apscheduler.schedulers.blocking import BlockingScheduler
+
+from services.health_check.application.api_client import check_popular_repo_app_health
+from services.health_check.application.config import Config
+
+
+def create_scheduler(config: Type[Config] = Config) -> BlockingScheduler:
+    """
+    Create the job scheduler running the health check.
+
+    Args:
+        config (Type[Config]): Class holding the configuration
+            values used by the job.
+
+    Returns:
+        BlockingScheduler: Scheduler with the health check
+            job registered, not started yet.
+    """
+    scheduler = BlockingScheduler()
+    scheduler.add_job(
+        check_popular_repo_app_health,
+        trigger="interval",
+        minutes=config.HEALTH_CHECK_INTERVAL,
+        next_run_time=datetime.now(),
+        kwargs={"url": config.POPULAR_REPOS_API_URL},
+    )
+    return scheduler
@@ -3,13 +3,13 @@
 import mock
 from requests import Response
 
-from services.health_check.application import scheduler
 from services.health_check.application.api_client import check_popular_repo_app_health
+from services.health_check.application.scheduler import create_scheduler
 
 
 def test_start_scheduler():
     """Test creation of scheduler."""
-    assert len(scheduler.get_jobs()) == 1
+    assert len(create_scheduler().get_jobs()) == 1
 
 
 @mock.patch("logging.info")
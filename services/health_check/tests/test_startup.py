@@ -0,0 +1,70 @@
+"""
+Startup benchmark for the health checker.
+
+The app being checked is mocked, so what is measured is the
+health checker's own import and first check latency. The first
+check is timed from the start of the scheduler until its job
+fires, as it happens in the container.
+"""
+
+import pytest
+
+pytestmark = pytest.mark.startup
+
+IMPORT_BUDGET = 0.65  # seconds
+FIRST_CHECK_BUDGET = 0.005  # seconds
+
+BENCHMARK_SCRIPT = """
+import json
+import time
+
+start = time.perf_counter()
+from services.health_check.application.scheduler import create_scheduler
+scheduler = create_scheduler()
+imported = time.perf_counter()
+
+import threading
+import mock
+from requests import Response
+
+response = Response()
+response.status_code = 200
+checked = threading.Event()
+
+def get(*args, **kwargs):
+    checked.set()
+    return response
+
+with mock.patch("requests.get", side_effect=get) as mocked_get:
+    first_check_start = time.perf_counter()
+    threading.Thread(target=scheduler.start, daemon=True).start()
+    checked.wait(timeout=10)
+    first_check = time.perf_counter() - first_check_start
+    scheduler.shutdown(wait=True)
+
+print(json.dumps({
+    "checks": mocked_get.call_count,
+    "import": imported - start,
+    "first_check": first_check,
+}))
+"""
+
+
+def test_import_does_not_create_scheduler(run_benchmark):
+    """Test that importing the package does not build the scheduler."""
+    script = (
+        "import json, sys\n"
+        "import services.health_check.application\n"
+        "print(json.dumps({'apscheduler': 'apscheduler' in sys.modules}))\n"
+    )
+    assert not run_benchmark(script)["apscheduler"]
+
+
+def test_startup_time_budget(run_benchmark, startup_budget):
+    """Test that import and first health check fit in their budgets."""
+    measurements = run_benchmark(BENCHMARK_SCRIPT)
+    assert measurements["checks"] == 1
+    assert measurements["import"] < startup_budget(IMPORT_BUDGET), measurements
+    assert measurements["first_check"] < startup_budget(
+        FIRST_CHECK_BUDGET
+    ), measurements
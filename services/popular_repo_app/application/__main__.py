@@ -1,7 +1,7 @@
 """Main module which starts the application."""
 
-from services.popular_repo_app.application.app import app
+from services.popular_repo_app.application.app import create_app
 
 
 if __name__ == "__main__":
-    app.run(host="0.0.0.0")  # noqa
+    create_app().run(host="0.0.0.0")  # noqa
@@ -1,9 +1,17 @@
 """Module to create the Flask application."""
 
+from typing import Type
+
 from flask import Flask
 
+from services.popular_repo_app.application.config import Config
+from services.popular_repo_app.application.controllers.admin import admin
 from services.popular_repo_app.application.controllers.repositories import repositories
 from services.popular_repo_app.application.controllers.health import health
+from services.popular_repo_app.application.service.timing import (
+    add_server_timing_header,
+    start_timing,
+)
 
 
 def not_found_response(e):
@@ -19,15 +27,51 @@ def invalid_credentials_response(e):
     }, 401
 
 
+def forbidden_response(e):
+    """Handle 403 errors."""
+    return {"message": "Invalid admin token."}, 403
+
+
+def conflict_response(e):
+    """Handle 409 errors."""
+    return {"message": "A profile is already running, please try again later."}, 409
+
+
 def internal_error_response(e):
     """Handle 401 errors."""
     return {"message": "Internal server problems, please try again later."}, 500
 
 
-# Creates the Flask app.
-app = Flask(__name__)
-app.register_blueprint(repositories)
-app.register_blueprint(health)
-app.register_error_handler(404, not_found_response)
-app.register_error_handler(401, invalid_credentials_response)
-app.register_error_handler(500, internal_error_response)
+def create_app(config: Type[Config] = Config) -> Flask:
+    """
+    Create the Flask application.
+
+    Nothing is built when this module is imported, so the
+    app is only paid for by whoever actually needs one.
+
+    Instrumentation is opt-in: the Server-Timing header and
+    the admin profiling endpoint are only set up when enabled
+    in the configuration, costing nothing otherwise.
+
+    Args:
+        config (Type[Config]): Class holding the configuration
+            values loaded into the app.
+
+    Returns:
+        Flask: The configured application.
+    """
+    app = Flask(__name__)
+    app.config.from_object(config)
+    app.register_blueprint(repositories)
+    app.register_blueprint(health)
+    app.register_error_handler(404, not_found_response)
+    app.register_error_handler(401, invalid_credentials_response)
+    app.register_error_handler(403, forbidden_response)
+    app.register_error_handler(409, conflict_response)
+    app.register_error_handler(500, internal_error_response)
+    if app.config["SERVER_TIMING_ENABLED"]:
+        app.before_request(start_timing)
+        app.after_request(add_server_timing_header)
+    if app.config["PROFILER_ENABLED"]:
+        app.register_blueprint(admin)
+    return app
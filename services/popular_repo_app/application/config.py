@@ -8,3 +8,8 @@ class Config:
 
     GITHUB_ACCESS_TOKEN = getenv("GITHUB_ACCESS_TOKEN")
     GITHUB_API_URL = "https://api.github.com"
+    SERVER_TIMING_ENABLED = getenv("SERVER_TIMING_ENABLED", "false") == "true"
+    PROFILER_ENABLED = getenv("PROFILER_ENABLED", "false") == "true"
+    PROFILER_TOKEN = getenv("PROFILER_TOKEN")
+    PROFILER_INTERVAL = 0.005  # seconds
+    PROFILER_MAX_DURATION = 60  # seconds
@@ -0,0 +1,62 @@
+"""Controller for the app's admin endpoints."""
+
+from hmac import compare_digest
+
+from flask import Blueprint, abort, current_app, request
+
+from services.popular_repo_app.application.service.exceptions import (
+    ProfilerAlreadyRunning,
+)
+from services.popular_repo_app.application.service.profiler import (
+    collapse_stacks,
+    sample_stacks,
+)
+
+
+admin = Blueprint("admin", __name__)
+
+
+@admin.before_request
+def check_admin_token():
+    """
+    Check the admin token sent in the Authorization header.
+
+    The token is configured in PROFILER_TOKEN and sent as
+    "Bearer <token>". Without a configured token, no request
+    is allowed.
+
+    Raises:
+        HTTPException: If the token is missing or invalid. The 403
+            error handler will be triggered.
+    """
+    token = current_app.config["PROFILER_TOKEN"]
+    authorization = request.headers.get("Authorization", "").encode()
+    if not token or not compare_digest(authorization, f"Bearer {token}".encode()):
+        abort(403)
+
+
+@admin.route("/admin/profile", methods=("GET",))
+def profile():
+    """
+    Profile the app's threads for a few seconds.
+
+    The number of seconds is given in the query parameter
+    seconds (1 by default) and is capped by the configuration
+    value PROFILER_MAX_DURATION.
+
+    Returns:
+        Tuple[str, int, Dict[str, str]]: Collapsed stacks of the
+            threads, one per line followed by the number of
+            samples, ready to be turned into a flame graph.
+
+    Raises:
+        HTTPException: If another profile is already running. The
+            409 error handler will be triggered.
+    """
+    seconds = request.args.get("seconds", default=1.0, type=float)
+    seconds = min(max(seconds, 0.0), current_app.config["PROFILER_MAX_DURATION"])
+    try:
+        samples = sample_stacks(seconds, current_app.config["PROFILER_INTERVAL"])
+    except ProfilerAlreadyRunning:
+        abort(409)
+    return collapse_stacks(samples), 200, {"Content-Type": "text/plain"}
@@ -9,6 +9,7 @@ from services.popular_repo_app.application.service.exceptions import (
     InvalidGithubCredentials,
 )
 from services.popular_repo_app.application.service.github_client import get_repository
+from services.popular_repo_app.application.service.timing import timed
 
 
 def calculate_score(num_stars: int, num_forks: int):
@@ -62,12 +63,13 @@ def get_repository_popularity(
         if e.response.status_code == 404:
             raise RepositoryNotFound()
     else:
-        num_stars = repository["stargazers_count"]
-        num_forks = repository["forks_count"]
-        score = calculate_score(num_stars, num_forks)
-        return {
-            "num_stars": num_stars,
-            "num_forks": num_forks,
-            "score": score,
-            "popular": score >= 500,
-        }
+        with timed("evaluation"):
+            num_stars = repository["stargazers_count"]
+            num_forks = repository["forks_count"]
+            score = calculate_score(num_stars, num_forks)
+            return {
+                "num_stars": num_stars,
+                "num_forks": num_forks,
+                "score": score,
+                "popular": score >= 500,
+            }
@@ -13,3 +13,10 @@ class InvalidGithubCredentials(Exception):
 
     def __init__(self):
         super(InvalidGithubCredentials, self).__init__()
+
+
+class ProfilerAlreadyRunning(Exception):
+    """A profile was requested while another one is running."""
+
+    def __init__(self):
+        super(ProfilerAlreadyRunning, self).__init__()
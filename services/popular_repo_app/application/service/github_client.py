@@ -1,10 +1,53 @@
 """Module to interact with the Github API."""
 
+from http.cookiejar import DefaultCookiePolicy
+from threading import Lock
 from typing import Any, Dict
+from weakref import finalize
 
 import requests
+from flask import current_app
 
-from services.popular_repo_app.application.config import Config
+from services.popular_repo_app.application.service.timing import timed
+
+_session_lock = Lock()
+
+
+def get_session() -> requests.Session:
+    """
+    Get the HTTP session used to talk to Github.
+
+    Each app has one session, created on its first call and
+    then shared by all its threads, keeping the connections to
+    Github alive between requests. Its connection pool is thread
+    safe and cookies are never kept, so nothing is carried from
+    one user's request to another's. The session is closed when
+    the app is garbage collected or the interpreter exits.
+
+    Returns:
+        requests.Session: Session of the current app.
+    """
+    session = current_app.extensions.get("github_session")
+    if session is None:
+        with _session_lock:
+            session = current_app.extensions.get("github_session")
+            if session is None:
+                session = requests.Session()
+                session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+                app = current_app._get_current_object()
+                finalize(app, session.close)
+                app.extensions["github_session"] = session
+    return session
+
+
+def get_headers() -> Dict[str, str]:
+    """
+    Get the headers required by the Github API.
+
+    Returns:
+        Dict[str, str]: Headers with the app's access token.
+    """
+    return {"Authorization": f"Bearer {current_app.config['GITHUB_ACCESS_TOKEN']}"}
 
 
 def check_github_api_connection():
@@ -15,8 +58,10 @@ def check_github_api_connection():
         requests.exceptions.HTTPError: If connection has
             a problem.
     """
-    headers = {"Authorization": f"Bearer {Config.GITHUB_ACCESS_TOKEN}"}
-    response = requests.get(Config.GITHUB_API_URL, headers=headers)
+    with timed("upstream"):
+        response = get_session().get(
+            current_app.config["GITHUB_API_URL"], headers=get_headers()
+        )
     response.raise_for_status()
 
 
@@ -36,8 +81,10 @@ def get_repository(user_name: str, repository_name: str) -> Dict[str, Any]:
         requests.exceptions.HTTPError: If repo wasn't found or if
             credentials are not valid.
     """
-    repository_url = f"{Config.GITHUB_API_URL}/repos/{user_name}/{repository_name}"
-    headers = {"Authorization": f"Bearer {Config.GITHUB_ACCESS_TOKEN}"}
-    response = requests.get(repository_url, headers=headers)
+    api_url = current_app.config["GITHUB_API_URL"]
+    repository_url = f"{api_url}/repos/{user_name}/{repository_name}"
+    with timed("upstream"):
+        response = get_session().get(repository_url, headers=get_headers())
     response.raise_for_status()
-    return response.json()
+    with timed("decode"):
+        return response.json()
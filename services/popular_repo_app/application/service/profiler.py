@@ -0,0 +1,99 @@
+"""Module with a sampling profiler for the app's threads."""
+
+import sys
+import threading
+from collections import Counter
+from time import monotonic, sleep
+from types import FrameType
+from typing import Dict, Tuple
+
+from services.popular_repo_app.application.service.exceptions import (
+    ProfilerAlreadyRunning,
+)
+
+Frame = Tuple[str, str, int]
+Stack = Tuple[Frame, ...]
+
+_running = threading.Lock()
+
+
+def get_stack(frame: FrameType) -> Stack:
+    """
+    Get the raw stack of a frame.
+
+    Args:
+        frame (FrameType): Innermost frame of the stack.
+
+    Returns:
+        Stack: File name, function name and line of each
+            frame, from the innermost to the outermost.
+    """
+    stack = []
+    while frame is not None:
+        code = frame.f_code
+        stack.append((code.co_filename, code.co_name, frame.f_lineno))
+        frame = frame.f_back
+    return tuple(stack)
+
+
+def sample_stacks(duration: float, interval: float) -> Dict[Tuple[str, Stack], int]:
+    """
+    Sample the stacks of all the other threads.
+
+    Every interval, the current stack of each thread is taken
+    and counted. Taking a sample holds the GIL, so the other
+    threads wait while their stacks are walked, which is why
+    only raw frames are kept and formatting is left for later.
+    Only one profile runs at a time.
+
+    Args:
+        duration (float): For how long to sample, in seconds.
+        interval (float): Time between two samples, in seconds.
+
+    Returns:
+        Dict[Tuple[str, Stack], int]: Number of times each stack
+            was seen, keyed by the name of its thread and the stack.
+
+    Raises:
+        ProfilerAlreadyRunning: If another profile is running.
+    """
+    if not _running.acquire(blocking=False):
+        raise ProfilerAlreadyRunning()
+    try:
+        own_thread = threading.get_ident()
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        samples = Counter()
+        end = monotonic() + duration
+        while monotonic() < end:
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id != own_thread:
+                    samples[thread_id, get_stack(frame)] += 1
+            sleep(interval)
+        names.update((thread.ident, thread.name) for thread in threading.enumerate())
+    finally:
+        _running.release()
+    return {
+        (names.get(thread_id, str(thread_id)), stack): count
+        for (thread_id, stack), count in samples.items()
+    }
+
+
+def collapse_stacks(samples: Dict[Tuple[str, Stack], int]) -> str:
+    """
+    Render sampled stacks as text suitable for flame graphs.
+
+    Frames are separated by semicolons, from the thread's name
+    and its outermost frame to the innermost one.
+
+    Args:
+        samples (Dict[Tuple[str, Stack], int]): Number of times
+            each stack was seen.
+
+    Returns:
+        str: One line per stack, followed by its count.
+    """
+    lines = Counter()
+    for (thread_name, stack), count in samples.items():
+        frames = (f"{name} ({file_name}:{line})" for file_name, name, line in stack)
+        lines[";".join((thread_name, *reversed(tuple(frames))))] += count
+    return "".join(f"{stack} {count}\n" for stack, count in sorted(lines.items()))
@@ -0,0 +1,58 @@
+"""Module to measure how long each phase of a request takes."""
+
+from contextlib import contextmanager
+from time import perf_counter
+from typing import Iterator
+
+from flask import g, has_app_context
+from flask.wrappers import Response
+
+
+def start_timing():
+    """Start collecting the timings of the current request."""
+    g.timings = {}
+    g.request_start = perf_counter()
+
+
+@contextmanager
+def timed(phase: str) -> Iterator[None]:
+    """
+    Measure the time spent in a phase of the current request.
+
+    Durations of the same phase are added up. If timings are not
+    being collected for the request, nothing is measured.
+
+    Args:
+        phase (str): Name of the phase, as shown in the
+            Server-Timing header.
+    """
+    timings = g.get("timings") if has_app_context() else None
+    if timings is None:
+        yield
+        return
+    start = perf_counter()
+    try:
+        yield
+    finally:
+        timings[phase] = timings.get(phase, 0.0) + perf_counter() - start
+
+
+def add_server_timing_header(response: Response) -> Response:
+    """
+    Add the timings of the current request to the response.
+
+    Every phase is reported in milliseconds in the Server-Timing
+    header, followed by the total time spent in the app.
+
+    Args:
+        response (Response): Response about to be returned.
+
+    Returns:
+        Response: The same response with the Server-Timing header.
+    """
+    timings = dict(g.get("timings", {}))
+    timings["total"] = perf_counter() - g.request_start
+    response.headers["Server-Timing"] = ", ".join(
+        f"{phase};dur={duration * 1000:.3f}" for phase, duration in timings.items()
+    )
+    return response
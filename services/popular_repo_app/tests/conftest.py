@@ -0,0 +1,22 @@
+"""Fixtures shared by the tests of the Flask application."""
+
+import pytest
+from flask.testing import FlaskClient
+
+from services.popular_repo_app.application.app import create_app
+from services.popular_repo_app.application.config import Config
+
+
+@pytest.fixture(scope="session")
+def app_test_client() -> FlaskClient:
+    """
+    Provide a test client for the application.
+
+    Flask framework provides an out-of-the-box testing
+    object to an application.
+
+    Returns:
+        FlaskClient: Test client for the application.
+    """
+    with create_app(Config).test_client() as client:
+        yield client
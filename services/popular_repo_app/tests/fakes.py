@@ -0,0 +1,28 @@
+"""Fake responses from the third party applications used in the tests."""
+
+import json
+from typing import Any, Dict, Optional
+
+from requests import Response
+
+
+def github_response(
+    status_code: int = 200, body: Optional[Dict[str, Any]] = None
+) -> Response:
+    """
+    Build a response from the Github API.
+
+    Args:
+        status_code (int): Status code of the response.
+        body (Optional[Dict[str, Any]]): Body of the response.
+            Defaults to a popular repository.
+
+    Returns:
+        Response: Response as returned by the requests lib.
+    """
+    if body is None:
+        body = {"stargazers_count": 500, "forks_count": 10}
+    response = Response()
+    response.status_code = status_code
+    response._content = json.dumps(body).encode()
+    return response
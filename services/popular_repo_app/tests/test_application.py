@@ -19,16 +19,20 @@ test coverage might help you find flows that are not being
 actioned (possible bugs or unachievable lines of code).
 """
 
+import gc
 from os import getenv
+from threading import Thread
 from typing import Any, Dict
 
 import mock
-import pytest
+import requests
 from flask.testing import FlaskClient
 from flask.wrappers import Response
 
-from services.popular_repo_app.application.app import app
+from services.popular_repo_app.application.app import create_app
 from services.popular_repo_app.application.config import Config
+from services.popular_repo_app.application.service.github_client import get_session
+from services.popular_repo_app.tests.fakes import github_response
 
 
 def assert_internal_server_response(response: Response):
@@ -147,21 +151,6 @@ def assert_wrong_credentials(response: Response):
     }
 
 
-@pytest.fixture(scope="session")
-def app_test_client() -> FlaskClient:
-    """
-    Provide a test client for the application.
-
-    Flask framework provides an out-of-the-box testing
-    object to an application.
-
-    Returns:
-        FlaskClient: Test client for the application.
-    """
-    with app.test_client() as client:
-        yield client
-
-
 def test_get_wrong_url(app_test_client: FlaskClient):
     """
     Test a get request to a URL that does not exist in the app.
@@ -254,7 +243,7 @@ def test_get_unpopular_repository(app_test_client: FlaskClient):
     assert_successful_response(response, should_be_popular=False)
 
 
-@mock.patch("requests.get")
+@mock.patch("requests.Session.get")
 def test_get_repo_with_github_api_down(
     mocked_get: mock.MagicMock, app_test_client: FlaskClient
 ):
@@ -284,9 +273,11 @@ def test_get_repo_without_github_credentials(app_test_client: FlaskClient):
         app_test_client (FlaskClient): Test client for the application
             provided out-of-the-box by the Flask framework.
     """
-    Config.GITHUB_ACCESS_TOKEN = None
+    app_test_client.application.config["GITHUB_ACCESS_TOKEN"] = None
     response = app_test_client.get("pallets/flask")
-    Config.GITHUB_ACCESS_TOKEN = getenv("GITHUB_ACCESS_TOKEN")
+    app_test_client.application.config["GITHUB_ACCESS_TOKEN"] = getenv(
+        "GITHUB_ACCESS_TOKEN"
+    )
     assert_wrong_credentials(response)
 
 
@@ -300,9 +291,11 @@ def test_get_repo_with_invalid_github_credentials(app_test_client: FlaskClient):
         app_test_client (FlaskClient): Test client for the application
             provided out-of-the-box by the Flask framework.
     """
-    Config.GITHUB_ACCESS_TOKEN = "invalid-token"
+    app_test_client.application.config["GITHUB_ACCESS_TOKEN"] = "invalid-token"
     response = app_test_client.get("pallets/flask")
-    Config.GITHUB_ACCESS_TOKEN = getenv("GITHUB_ACCESS_TOKEN")
+    app_test_client.application.config["GITHUB_ACCESS_TOKEN"] = getenv(
+        "GITHUB_ACCESS_TOKEN"
+    )
     assert_wrong_credentials(response)
 
 
@@ -318,7 +311,7 @@ def test_get_health_endpoint(app_test_client: FlaskClient):
     assert response.status_code == 200
 
 
-@mock.patch("requests.get")
+@mock.patch("requests.Session.get")
 def test_get_health_endpoint_with_github_down(
     mocked_get: mock.MagicMock, app_test_client: FlaskClient
 ):
@@ -332,3 +325,49 @@ def test_get_health_endpoint_with_github_down(
     mocked_get.side_effect = Exception("Exception from github connection")
     response = app_test_client.get("health")
     assert response.status_code == 500
+
+
+@mock.patch("requests.Session.get")
+def test_github_session_reused_across_requests(mocked_get: mock.MagicMock):
+    """
+    Test the Github session is created once per app and reused.
+
+    Like the development server, each request is served by a
+    new thread, and they must all share the same session.
+
+    Args:
+        mocked_get (mock.MagicMock): Mocker for the request to Github.
+    """
+    mocked_get.return_value = github_response()
+    app = create_app(Config)
+    status_codes = []
+
+    def get_repository():
+        status_codes.append(app.test_client().get("pallets/flask").status_code)
+
+    with mock.patch.object(
+        requests.Session,
+        "__init__",
+        autospec=True,
+        side_effect=requests.Session.__init__,
+    ) as mocked_init:
+        for _ in range(2):
+            thread = Thread(target=get_repository)
+            thread.start()
+            thread.join()
+        assert mocked_init.call_count == 1
+        with create_app(Config).app_context():
+            get_session()
+        assert mocked_init.call_count == 2
+    assert status_codes == [200, 200]
+
+
+def test_github_session_closed_with_app():
+    """Test the Github session is closed once its app is gone."""
+    with mock.patch.object(requests.Session, "close", autospec=True) as mocked_close:
+        app = create_app(Config)
+        with app.app_context():
+            session = get_session()
+        del app
+        gc.collect()
+        mocked_close.assert_called_once_with(session)
@@ -0,0 +1,163 @@
+"""Module to test the opt-in instrumentation of the application."""
+
+import threading
+from time import sleep
+
+import mock
+import pytest
+from flask.testing import FlaskClient
+
+from services.popular_repo_app.application.app import create_app
+from services.popular_repo_app.application.config import Config
+from services.popular_repo_app.application.service import profiler
+from services.popular_repo_app.tests.fakes import github_response
+
+ADMIN_HEADERS = {"Authorization": "Bearer admin-token"}
+
+
+class InstrumentedConfig(Config):
+    """Configuration with all the instrumentation enabled."""
+
+    SERVER_TIMING_ENABLED = True
+    PROFILER_ENABLED = True
+    PROFILER_TOKEN = "admin-token"
+
+
+@pytest.fixture(scope="session")
+def instrumented_client() -> FlaskClient:
+    """
+    Provide a test client for the application with instrumentation.
+
+    Returns:
+        FlaskClient: Test client for the instrumented application.
+    """
+    with create_app(InstrumentedConfig).test_client() as client:
+        yield client
+
+
+@mock.patch("requests.Session.get")
+def test_server_timing_header(
+    mocked_get: mock.MagicMock, instrumented_client: FlaskClient
+):
+    """
+    Test the Server-Timing header splits the request in phases.
+
+    Args:
+        mocked_get (mock.MagicMock): Mocker for the request to Github.
+        instrumented_client (FlaskClient): Test client for the
+            instrumented application.
+    """
+    mocked_get.return_value = github_response()
+    response = instrumented_client.get("pallets/flask")
+    assert response.status_code == 200
+    phases = [
+        metric.split(";")[0] for metric in response.headers["Server-Timing"].split(", ")
+    ]
+    assert phases == ["upstream", "decode", "evaluation", "total"]
+
+
+@mock.patch("requests.Session.get")
+def test_server_timing_disabled(
+    mocked_get: mock.MagicMock, app_test_client: FlaskClient
+):
+    """
+    Test the Server-Timing header is not sent by default.
+
+    Args:
+        mocked_get (mock.MagicMock): Mocker for the request to Github.
+        app_test_client (FlaskClient): Test client for the application.
+    """
+    mocked_get.return_value = github_response()
+    response = app_test_client.get("pallets/flask")
+    assert response.status_code == 200
+    assert "Server-Timing" not in response.headers
+
+
+def test_profile_endpoint(instrumented_client: FlaskClient):
+    """
+    Test the profiler samples the stacks of the other threads.
+
+    Args:
+        instrumented_client (FlaskClient): Test client for the
+            instrumented application.
+    """
+    stop = threading.Event()
+
+    def busy_worker():
+        while not stop.is_set():
+            sleep(0.001)
+
+    worker = threading.Thread(target=busy_worker, name="busy-worker")
+    worker.start()
+    try:
+        response = instrumented_client.get(
+            "admin/profile?seconds=0.1", headers=ADMIN_HEADERS
+        )
+    finally:
+        stop.set()
+        worker.join()
+    assert response.status_code == 200
+    assert response.content_type == "text/plain"
+    lines = response.get_data(as_text=True).splitlines()
+    worker_lines = [line for line in lines if line.startswith("busy-worker;")]
+    assert worker_lines
+    assert all("busy_worker (" in line for line in worker_lines)
+    assert all(int(line.rsplit(" ", 1)[1]) > 0 for line in worker_lines)
+
+
+@pytest.mark.parametrize(
+    "headers",
+    ({}, {"Authorization": "Bearer wrong-token"}, {"Authorization": "Bearer tokén"}),
+)
+def test_profile_endpoint_with_invalid_token(
+    headers: dict, instrumented_client: FlaskClient
+):
+    """
+    Test the profiler is only available with the admin token.
+
+    Args:
+        headers (dict): Headers sent with the request.
+        instrumented_client (FlaskClient): Test client for the
+            instrumented application.
+    """
+    response = instrumented_client.get("admin/profile?seconds=0", headers=headers)
+    assert response.status_code == 403
+    assert response.json == {"message": "Invalid admin token."}
+
+
+def test_profile_endpoint_already_running(instrumented_client: FlaskClient):
+    """
+    Test a second profile is rejected while one is running.
+
+    Args:
+        instrumented_client (FlaskClient): Test client for the
+            instrumented application.
+    """
+    with profiler._running:
+        response = instrumented_client.get(
+            "admin/profile?seconds=0", headers=ADMIN_HEADERS
+        )
+    assert response.status_code == 409
+    assert response.json == {
+        "message": "A profile is already running, please try again later."
+    }
+
+
+@mock.patch("requests.Session.get")
+def test_profile_endpoint_disabled(
+    mocked_get: mock.MagicMock, app_test_client: FlaskClient
+):
+    """
+    Test the profiler is not exposed by default.
+
+    The URL is then taken as a repository, which Github does
+    not find.
+
+    Args:
+        mocked_get (mock.MagicMock): Mocker for the request to Github.
+        app_test_client (FlaskClient): Test client for the application.
+    """
+    mocked_get.return_value = github_response(404, {"message": "Not Found"})
+    response = app_test_client.get("admin/profile", headers=ADMIN_HEADERS)
+    assert response.status_code == 404
+    assert response.json == {"message": "Resource not found."}
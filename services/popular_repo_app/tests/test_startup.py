@@ -0,0 +1,60 @@
+"""
+Startup benchmark for the Flask application.
+
+Github is mocked, so what is measured is the application's
+own import and first request latency.
+"""
+
+import pytest
+
+pytestmark = pytest.mark.startup
+
+IMPORT_BUDGET = 0.5  # seconds
+FIRST_REQUEST_BUDGET = 0.025  # seconds
+
+BENCHMARK_SCRIPT = """
+import json
+import time
+
+start = time.perf_counter()
+from services.popular_repo_app.application.app import create_app
+app = create_app()
+imported = time.perf_counter()
+
+import mock
+from services.popular_repo_app.tests.fakes import github_response
+
+with mock.patch("requests.Session.get", return_value=github_response()):
+    client = app.test_client()
+    first_request_start = time.perf_counter()
+    status_code = client.get("pallets/flask").status_code
+    first_request = time.perf_counter() - first_request_start
+
+print(json.dumps({
+    "status_code": status_code,
+    "import": imported - start,
+    "first_request": first_request,
+}))
+"""
+
+
+def test_import_does_not_create_app(run_benchmark):
+    """Test that importing the app module does not build the app."""
+    script = (
+        "import json\n"
+        "from flask import Flask\n"
+        "from services.popular_repo_app.application import app as module\n"
+        "apps = [v for v in vars(module).values() if isinstance(v, Flask)]\n"
+        "print(json.dumps({'apps': len(apps)}))\n"
+    )
+    assert run_benchmark(script)["apps"] == 0
+
+
+def test_startup_time_budget(run_benchmark, startup_budget):
+    """Test that import and first request fit in their budgets."""
+    measurements = run_benchmark(BENCHMARK_SCRIPT)
+    assert measurements["status_code"] == 200
+    assert measurements["import"] < startup_budget(IMPORT_BUDGET), measurements
+    assert measurements["first_request"] < startup_budget(
+        FIRST_REQUEST_BUDGET
+    ), measurements